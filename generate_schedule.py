@@ -16,6 +16,8 @@ from scheduling_automation import parse_input, generate_day_list, construct_and_
 parser = argparse.ArgumentParser()
 parser.add_argument('config_file')
 parser.add_argument('requests_file')
+parser.add_argument('--max_time', type=float, default=None, help="Time limit for the solver in seconds.")
+parser.add_argument('--no-hint', action='store_true', help="Do not use the previous schedule as a hint for the solver.")
 args = parser.parse_args()
 
 with open(args.config_file) as f:
@@ -54,7 +56,9 @@ construct_and_optimize(worker_list=worker_list,
                        day_list=day_list,
                        workplace_weights=workplace_weights,
                        penalty_weekend_package=config["penalty_weekend_package"],
-                       penalty_equal_distribution=config["penalty_equal_distribution"]
+                       penalty_equal_distribution=config["penalty_equal_distribution"],
+                       max_time_in_seconds=args.max_time,
+                       hint_file=None if args.no_hint else "schedule.hint.npz"
                        )
 
 print("DONE")
@@ -1,17 +1,40 @@
 """
 Contains functions used to generate a list of days of the month,
-and a class that adds new functionality to datetime.date.
+and a class that stores each day with its properties.
 """
 
+from dataclasses import dataclass, field
 from datetime import date, timedelta
+from functools import lru_cache
 import calendar
 import holidays
+import numpy as np
 
-class Day(date):
+
+@lru_cache(maxsize=None)
+def _slovenia_holidays(year : int) -> frozenset[date]:
+    """
+    The Slovenian holidays in the given year.
+    Cached, so the holidays are only constructed once per year.
     """
-    The class inherits everything from date.
-    Adds the check if the date is a holiday.
+    return frozenset(holidays.Slovenia(years=year).keys())
+
+@dataclass(slots=True, frozen=True)
+class Day:
     """
+    A day of the schedule.
+    Contains the date and its properties: whether it is a holiday,
+    a weekend or a workday. These are computed once, when the Day is
+    constructed with Day.from_date().
+    """
+
+    year : int
+    month : int
+    day : int
+    is_workday : bool = field(repr=False)
+    is_weekend : bool = field(repr=False)
+    is_holiday : bool = field(repr=False)
+    isoweekday : int = field(repr=False)
 
     _month_repr ={
         1 : "JAN",
@@ -28,20 +51,23 @@ class Day(date):
         12 : "DEC",
     }
 
-    def __new__(cls, year, month, day):
-        return super().__new__(cls, year, month, day)
-
-    @property
-    def is_holiday(self):
-        return self in holidays.Slovenia(years=self.year)
-
-    @property
-    def is_weekend(self):
-        return self.isoweekday() in [ 6, 7 ]
-
-    @property
-    def is_workday(self):
-        return not (self.is_holiday or self.is_weekend)
+    @classmethod
+    def from_date(cls, dd : date) -> "Day":
+        """
+        Constructs the Day and computes its properties.
+        """
+        is_holiday = dd in _slovenia_holidays(dd.year)
+        isoweekday = dd.isoweekday()
+        is_weekend = isoweekday in [ 6, 7 ]
+        return cls(
+            year=dd.year,
+            month=dd.month,
+            day=dd.day,
+            is_workday=not (is_holiday or is_weekend),
+            is_weekend=is_weekend,
+            is_holiday=is_holiday,
+            isoweekday=isoweekday,
+        )
 
     def __str__(self) -> str:
         """
@@ -49,9 +75,9 @@ class Day(date):
         and 25.dec for the 25th of December and non-working days.
         """
         if self.is_workday:
-            month_str = _month_repr[self.month].upper()
+            month_str = self._month_repr[self.month].upper()
         else:
-            month_str = _month_repr[self.month].lower()
+            month_str = self._month_repr[self.month].lower()
         return f"{self.day}.{month_str}"
 
 
@@ -70,6 +96,26 @@ def generate_day_list(start_date : date, end_date : date) -> list[Day]:
     """
 
     all_dates = [start_date + timedelta(days=ii) for ii in range((end_date - start_date).days + 1)]
-    day_list = [ Day(dd.year, dd.month, dd.day) for dd in all_dates ]
+    day_list = [ Day.from_date(dd) for dd in all_dates ]
 
     return day_list
+
+
+def day_flags(day_list : list[Day]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Collects the properties of the days into arrays, so they are
+    only evaluated once and can be indexed by the day index.
+
+    Arguments:
+        day_list : list[Day]
+            The list of days.
+    Returns:
+        tuple[np.ndarray, np.ndarray]
+        The boolean array is_workday, and the integer array of isoweekdays.
+    """
+
+    num_days = len(day_list)
+    is_workday = np.fromiter((dd.is_workday for dd in day_list), dtype=bool, count=num_days)
+    isoweekday = np.fromiter((dd.isoweekday for dd in day_list), dtype=np.int8, count=num_days)
+
+    return is_workday, isoweekday
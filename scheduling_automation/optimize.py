@@ -2,13 +2,16 @@
 Contains the construction of the model.
 """
 import csv
+import os
+import zipfile
+import numpy as np
 from ortools.sat.python import cp_model
 
-from .days import Day
-from .worker import Worker, ALL_WORKPLACES
+from .days import Day, day_flags
+from .worker import Worker, ALL_WORKPLACES_ORDERED
 
 
-def construct_and_optimize(worker_list : list[Worker], day_list : list[Day], workplace_weights : list[int], penalty_weekend_package : int, penalty_equal_distribution : int) -> None:
+def construct_and_optimize(worker_list : list[Worker], day_list : list[Day], workplace_weights : list[int], penalty_weekend_package : int, penalty_equal_distribution : int, max_time_in_seconds : float | None = None, hint_file : str | None = None) -> None:
     """
     Defines the model used for optimization, and optimizes it.
 
@@ -41,11 +44,18 @@ def construct_and_optimize(worker_list : list[Worker], day_list : list[Day], wor
             List of days in the month.
         workplace_weights : list[int]
             The weights assigned to each workplace when optimizing the
-            schedule. Must match the alphabetical order of workplaces in ALL_WORKPLACES.
+            schedule. Must match the alphabetical order of workplaces in ALL_WORKPLACES_ORDERED.
         penalty_weekend_package : int
             The weight penalising the assignment of the weekend package.
         penalty_equal_distribution : int
             The weight penalising the imbalanced distribution of a worker across workplaces.
+        max_time_in_seconds : float | None
+            The time limit for the solver. If None, the solver runs until it
+            finds the optimal solution.
+        hint_file : str | None
+            The file storing the solution of the previous run. If it exists, the
+            previous solution is used as a hint for the solver (warm start), and the
+            new solution is written to it. If None (default), no hint is used or stored.
 
     Returns:
         CpModel
@@ -58,138 +68,162 @@ def construct_and_optimize(worker_list : list[Worker], day_list : list[Day], wor
     # some useful numbers
     num_workers = len(worker_list)
     num_days = len(day_list)
-    num_workplaces = len(ALL_WORKPLACES)
+    num_workplaces = len(ALL_WORKPLACES_ORDERED)
 
-    nzv_index = ALL_WORKPLACES.index("NZV")
-    porodna_index = ALL_WORKPLACES.index("PORODNA")
-    pops_index = ALL_WORKPLACES.index("POPS")
-    tx_index = ALL_WORKPLACES.index("TX")
+    nzv_index = ALL_WORKPLACES_ORDERED.index("NZV")
+    porodna_index = ALL_WORKPLACES_ORDERED.index("PORODNA")
+    pops_index = ALL_WORKPLACES_ORDERED.index("POPS")
+    tx_index = ALL_WORKPLACES_ORDERED.index("TX")
+
+    # evaluate the properties of the days only once
+    workday_arr, isoweekday_arr = day_flags(day_list)
+
+    # The requests of all workers as arrays:
+    # workplace_mask[ww, pp] is True if the worker ww can work at the workplace pp,
+    # work_dates_matrix[ww, dd] is True if the worker ww can work on day dd,
+    # weekend_pref[ww] is the weekend package preference of the worker ww.
+    workplace_mask, work_dates_matrix, weekend_pref = Worker.as_arrays(worker_list)
+
+    # possible[ww, dd, pp] is True if the assignment is possible:
+    # the worker works at the workplace, can work that day, and POPS is only open on workdays.
+    site_open = np.ones((num_days, num_workplaces), dtype=bool)
+    site_open[:, pops_index] = workday_arr
+    possible = workplace_mask[:, None, :] & work_dates_matrix[:, :, None] & site_open[None, :, :]
 
     # Variables: work[(ww, dd, pp)] = 1 if worker w works site s on day d
     # In for loops: ww - workers, dd - days, pp - places
+    # Variables are only created where the assignment is possible.
+    # This replaces the constraints forcing the other variables to zero.
+    # A missing entry is treated as 0: sums and constraints only include the
+    # entries with (ww, dd, pp) in work.
     work = {}
-    for ww in range(num_workers):
-            for dd in range(num_days):
-                for pp in range(num_workplaces):
-                    work[ww, dd, pp] = model.NewBoolVar(f'work_{ww}_{dd}_{pp}')
+    for ww, dd, pp in zip(*np.nonzero(possible)):
+        ww, dd, pp = int(ww), int(dd), int(pp)
+        work[ww, dd, pp] = model.NewBoolVar(f'work_{ww}_{dd}_{pp}')
+
+    # Warm start: use the solution of the previous run as a hint.
+    if hint_file is not None:
+        hint = load_hint(hint_file, worker_list, num_days, num_workplaces)
+        if hint is not None:
+            for key, var in work.items():
+                model.AddHint(var, int(hint[key]))
 
     # Constraint: exactly one worker per site.
-    for dd, day in enumerate(day_list):
-        model.add_exactly_one(work[ww, dd, nzv_index] for ww in range(num_workers) )
-        model.add_exactly_one(work[ww, dd, porodna_index] for ww in range(num_workers) )
-        model.add_exactly_one(work[ww, dd, tx_index] for ww in range(num_workers) )
+    for dd in range(num_days):
+        model.add_exactly_one(work[ww, dd, nzv_index] for ww in range(num_workers) if (ww, dd, nzv_index) in work)
+        model.add_exactly_one(work[ww, dd, porodna_index] for ww in range(num_workers) if (ww, dd, porodna_index) in work)
+        model.add_exactly_one(work[ww, dd, tx_index] for ww in range(num_workers) if (ww, dd, tx_index) in work)
 
         # POPS only on workdays
-        if day.is_workday:
-            model.Add( sum( work[ww, dd, pops_index] for ww in range(num_workers)) == 1)
-        else:
-            model.Add( sum( work[ww, dd, pops_index] for ww in range(num_workers)) == 0)
-
-    # Constraint: worker works only in certain workplaces
-    for ww, worker in enumerate(worker_list):
-        for dd in range(num_days):
-            for pp, workplace in enumerate(ALL_WORKPLACES):
-                if workplace not in worker.workplaces:
-                    model.Add( work[ww, dd, pp] == 0 )
+        if workday_arr[dd]:
+            model.add_exactly_one(work[ww, dd, pops_index] for ww in range(num_workers) if (ww, dd, pops_index) in work)
 
-    # Constraint: at most one shift per day, if the worker can work.
-    for ww, worker in enumerate(worker_list):
+    # Constraint: at most one shift per day.
+    for ww in range(num_workers):
         for dd in range(num_days):
-            if worker.work_dates[dd]:
-                model.Add( sum( work[ww, dd, pp] for pp in range(num_workplaces) ) <= 1 )
-            else:
-                model.Add( sum( work[ww, dd, pp] for pp in range(num_workplaces) ) == 0 )
+            shifts = [ work[ww, dd, pp] for pp in range(num_workplaces) if (ww, dd, pp) in work ]
+            if len(shifts) > 1:
+                model.Add( cp_model.LinearExpr.Sum(shifts) <= 1 )
 
     # Constraint: After working NZV or PORODNA or POPS, next day off
     for ww in range(num_workers):
         for dd in range(num_days - 1):
             # If work porodna or nzv or pops on day dd then no work on day dd+1
-            model.Add(work[ww, dd, nzv_index] + work[ww, dd, porodna_index] + work[ww, dd, pops_index] + sum(work[ww, dd+1, pp] for pp in range(num_workplaces)) <= 1)
+            for site in (nzv_index, porodna_index, pops_index):
+                if (ww, dd, site) not in work:
+                    continue
+                for pp in range(num_workplaces):
+                    if (ww, dd+1, pp) in work:
+                        model.AddImplication(work[ww, dd, site], work[ww, dd+1, pp].Not())
 
 
     ####################################################################################################################################
     # Weekend package soft assignment: assign worker to work Fri and Sun (nzv or porodna) up to once per month
 
     # All Fridays where the ensuing Sunday is included in the month.
-    fridays = [ ii for ii, day in enumerate(day_list) if day.isoweekday() == 5 and ii + 2 < len(day_list) ]
+    fridays = [ int(ii) for ii in np.flatnonzero(isoweekday_arr == 5) if ii + 2 < num_days ]
 
     assigned_weekends = []
     weekend_penalties = []
     # Enforce at most one weekend package per worker
-    for ww, worker in enumerate(worker_list):
+    for ww in range(num_workers):
         and_vars = []
         for dd in fridays:
-            # For each combination of site assignments on Friday and Sunday
-            for (site1, site2) in [
-                (porodna_index, porodna_index),
-                (nzv_index, nzv_index),
-                (nzv_index, porodna_index),
-                (porodna_index, nzv_index)
-            ]:
-                and_var = model.NewBoolVar(f'and_{ww}_{dd}_{site1}_{site2}')
-                # and_var is true iff both Friday and Sunday sites are assigned accordingly
-                # Model: and_var = work[ww, dd, site1] AND work[ww, dd + 2, site2]
-                model.AddBoolAnd([work[ww, dd, site1], work[ww, dd + 2, site2]]).OnlyEnforceIf(and_var)
-                model.AddBoolOr([work[ww, dd, site1].Not(), work[ww, dd + 2, site2].Not()]).OnlyEnforceIf(and_var.Not())
-                and_vars.append(and_var)
-
+            # The NZV or PORODNA shifts on Friday and Sunday.
+            # As the worker works at most one shift per day, their sum is 0 or 1.
+            friday_shifts = [ work[ww, dd, pp] for pp in (nzv_index, porodna_index) if (ww, dd, pp) in work ]
+            sunday_shifts = [ work[ww, dd + 2, pp] for pp in (nzv_index, porodna_index) if (ww, dd + 2, pp) in work ]
+
+            # skip the weekends which can not be assigned
+            if not friday_shifts or not sunday_shifts:
+                continue
+
+            friday_var = model.NewBoolVar(f'friday_{ww}_{dd}')
+            sunday_var = model.NewBoolVar(f'sunday_{ww}_{dd + 2}')
+            model.Add(friday_var == cp_model.LinearExpr.Sum(friday_shifts))
+            model.Add(sunday_var == cp_model.LinearExpr.Sum(sunday_shifts))
+
+            # and_var is true iff the worker works NZV or PORODNA on both Friday and Sunday
+            # Model: and_var = friday_var * sunday_var
+            and_var = model.NewBoolVar(f'and_{ww}_{dd}')
+            model.AddMultiplicationEquality(and_var, [friday_var, sunday_var])
+            and_vars.append(and_var)
 
         # At most one such weekend package assignment per worker across all Fridays
-        model.Add(sum(and_vars) <= 1)
+        model.Add(cp_model.LinearExpr.Sum(and_vars) <= 1)
 
-        # Introduce a worker-level binary var to indicate weekend package assignment
-        assigned_weekend_package = model.NewBoolVar(f'assigned_weekend_package_{ww}')
+        # As at most one of the and_vars is true, their sum indicates the weekend package assignment.
+        assigned_weekend_package = cp_model.LinearExpr.Sum(and_vars)
         assigned_weekends.append(assigned_weekend_package)
 
-        # Link assigned_weekend_package to the or of all and_vars
-        model.AddBoolOr(and_vars).OnlyEnforceIf(assigned_weekend_package)
-        model.AddBoolAnd([var.Not() for var in and_vars]).OnlyEnforceIf(assigned_weekend_package.Not())
-
         # Add penalty * weight to the objective to soften weekend package assignment
-        weekend_penalties.append(assigned_weekend_package * worker.weekend_package * (-1) )
+        weekend_penalties.append(assigned_weekend_package * int(weekend_pref[ww]) * (-1) )
 
     # Collect the total penalty
     total_weekend_penalty = model.NewIntVar(-num_workers, num_workers, 'total_penalty')
-    model.Add(total_weekend_penalty == sum(weekend_penalties))
+    model.Add(total_weekend_penalty == cp_model.LinearExpr.Sum(weekend_penalties))
 
     ####################################################################################################################################
     # Soft constraint for a balanced assignment across workplaces.
 
-    imbalance_penalties = []
-
-    total_work_site = {}
-    max_work_site = []
-    min_work_site = []
-    imbalances = []
-    for ww, worker in enumerate(worker_list):
-        works = []
-
-        # Iterate over the workplaces each worker works at and collect the number of times
-        # he is assigned to each.
-        for pp in range(num_workplaces):
-            if ALL_WORKPLACES[pp] in worker.workplaces:
-                total = model.NewIntVar(0, num_days, f'total_work_site_{ww}_{pp}')
-                model.Add(total == sum(work[ww, dd, pp] for dd in range(num_days)))
-                total_work_site[ww, pp] = total
-                works.append(total)
-
-        # max_pp and min_pp encode max(works) and min(works) respectively.
-        # These is the biggest and smallest number of assignments for each worker.
-        max_pp = model.NewIntVar(0, num_days, f'max_work_site_{ww}')
-        min_pp = model.NewIntVar(0, num_days, f'min_work_site_{ww}')
-        model.AddMaxEquality(max_pp, works)
-        model.AddMinEquality(min_pp, works)
-        max_work_site.append(max_pp)
-        min_work_site.append(min_pp)
-
-        # imb is the imbalance: the difference between the min and max
-        imb = model.NewIntVar(0, num_days, f'imbalance_{ww}')
-        model.Add(imb == max_pp - min_pp)
-        imbalances.append(imb)
-
-    # Collect the total penalty across all workers
-    total_imbalance = model.NewIntVar(0, num_workers * num_days, 'total_imbalance')
-    model.Add(total_imbalance == sum(imbalances))
+    # The imbalance does not contribute to the objective if its penalty is zero,
+    # so it is only constructed when needed.
+    if penalty_equal_distribution != 0:
+        imbalance_penalties = []
+
+        total_work_site = {}
+        max_work_site = []
+        min_work_site = []
+        imbalances = []
+        for ww in range(num_workers):
+            works = []
+
+            # Iterate over the workplaces each worker works at and collect the number of times
+            # he is assigned to each.
+            for pp in range(num_workplaces):
+                if workplace_mask[ww, pp]:
+                    total = model.NewIntVar(0, num_days, f'total_work_site_{ww}_{pp}')
+                    model.Add(total == cp_model.LinearExpr.Sum([ work[ww, dd, pp] for dd in range(num_days) if (ww, dd, pp) in work ]))
+                    total_work_site[ww, pp] = total
+                    works.append(total)
+
+            # max_pp and min_pp encode max(works) and min(works) respectively.
+            # These is the biggest and smallest number of assignments for each worker.
+            max_pp = model.NewIntVar(0, num_days, f'max_work_site_{ww}')
+            min_pp = model.NewIntVar(0, num_days, f'min_work_site_{ww}')
+            model.AddMaxEquality(max_pp, works)
+            model.AddMinEquality(min_pp, works)
+            max_work_site.append(max_pp)
+            min_work_site.append(min_pp)
+
+            # imb is the imbalance: the difference between the min and max
+            imb = model.NewIntVar(0, num_days, f'imbalance_{ww}')
+            model.Add(imb == max_pp - min_pp)
+            imbalances.append(imb)
+
+        # Collect the total penalty across all workers
+        total_imbalance = model.NewIntVar(0, num_workers * num_days, 'total_imbalance')
+        model.Add(total_imbalance == cp_model.LinearExpr.Sum(imbalances))
 
     ####################################################################################################################################
 
@@ -201,64 +235,86 @@ def construct_and_optimize(worker_list : list[Worker], day_list : list[Day], wor
     max_possible_work = num_days * max(workplace_weights) # one shift per day is the max
     for ww in range(num_workers):
         total = model.NewIntVar(0, max_possible_work, f'total_work_{ww}')
-        model.Add(total == sum(workplace_weights[pp] * work[ww, dd, pp] for dd in range(num_days) for pp in range(num_workplaces)))
+        flat_vars = [ work[ww, dd, pp] for dd in range(num_days) for pp in range(num_workplaces) if (ww, dd, pp) in work ]
+        flat_coeffs = [ workplace_weights[pp] for dd in range(num_days) for pp in range(num_workplaces) if (ww, dd, pp) in work ]
+        model.Add(total == cp_model.LinearExpr.WeightedSum(flat_vars, flat_coeffs))
         total_work.append(total)
 
-    max_work = model.NewIntVar(0, max_possible_work, 'max_work')
-    min_work = model.NewIntVar(0, max_possible_work, 'min_work')
-    model.AddMaxEquality(max_work, total_work)
-    model.AddMinEquality(min_work, total_work)
+    # Symmetry breaking: workers with identical requests are interchangeable.
+    # Order their workloads, so that the solver does not explore their permutations.
+    profiles = {}
+    for ww in range(num_workers):
+        profile = (workplace_mask[ww].tobytes(), work_dates_matrix[ww].tobytes(), int(weekend_pref[ww]))
+        profiles.setdefault(profile, []).append(ww)
+    for group in profiles.values():
+        for ii in range(len(group) - 1):
+            model.Add(total_work[group[ii]] <= total_work[group[ii + 1]])
+
+    # range_work is at least the difference between any two workers,
+    # so when minimized it equals max(total_work) - min(total_work).
+    range_work = model.NewIntVar(0, max_possible_work, 'range_work')
+    for ii in range(num_workers):
+        for jj in range(num_workers):
+            if ii != jj:
+                model.Add(total_work[ii] - total_work[jj] <= range_work)
 
     # Objective function:
-    model.Minimize((max_work - min_work) + (total_weekend_penalty * penalty_weekend_package) + (total_imbalance * penalty_equal_distribution))
+    objective = range_work + (total_weekend_penalty * penalty_weekend_package)
+    if penalty_equal_distribution != 0:
+        objective += total_imbalance * penalty_equal_distribution
+    model.Minimize(objective)
 
     # Solve model
     solver = cp_model.CpSolver()
+    # Run the search in parallel on all available cores.
+    solver.parameters.num_workers = os.cpu_count() or 1
+    if max_time_in_seconds is not None:
+        solver.parameters.max_time_in_seconds = max_time_in_seconds
     status = solver.Solve(model)
 
     # Write the output.
     schedule_array = []
     if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
-        for dd, day in enumerate(day_list):
-            #print(dd, day)
-            schedule_array.append([])
-            for pp, workplace in enumerate(ALL_WORKPLACES):
-                for ww in range(num_workers):
-
-                    # handle the POPS weekend separately
-                    if workplace == "POPS" and not day.is_workday:
-                        schedule_array[dd].append("NONE")
-                        break
-
-                    elif solver.Value(work[ww, dd, pp]) == 1:
-                        schedule_array[dd].append(worker_list[ww].surname.upper())
+        # Read the solution once into a dense array: vals[ww, dd, pp] = 1 if worker ww works site pp on day dd.
+        # The missing variables are 0.
+        vals = np.zeros((num_workers, num_days, num_workplaces), dtype=np.int8)
+        for key, var in work.items():
+            vals[key] = solver.Value(var)
+
+        # The assigned worker for each (day, site), and whether the site is assigned at all.
+        winners = vals.argmax(axis=0) # shape (num_days, num_workplaces)
+        any_assigned = vals.any(axis=0)
+        # POPS is not assigned on weekends and holidays, so these sites are "NONE".
+        for dd in range(num_days):
+            schedule_array.append([
+                worker_list[winners[dd, pp]].surname.upper() if any_assigned[dd, pp] else "NONE"
+                for pp in range(num_workplaces)
+            ])
 
         # Add the workplaces as the header
-        schedule_array.insert(0, ALL_WORKPLACES.copy())
+        schedule_array.insert(0, list(ALL_WORKPLACES_ORDERED))
     else:
         raise Exception(f"The optimization was not successful. The solver status is {status}.")
 
     ########################################################################
     # Collect and print some stats.
 
-    number_of_shifts = {
-        worker : sum( solver.Value(work[ww, dd, pp]) for dd in range(num_days) for pp in range(num_workplaces) )
-        for ww, worker in enumerate(worker_list)
-    }
+    shifts_per_workplace = vals.sum(axis=1) # shape (num_workers, num_workplaces)
+
     number_of_shifts_per_workplace = {
-        (worker, ALL_WORKPLACES[pp]) : sum( solver.Value(work[ww, dd, pp]) for dd in range(num_days))
+        (worker, ALL_WORKPLACES_ORDERED[pp]) : int(shifts_per_workplace[ww, pp])
         for pp in range(num_workplaces)
         for ww, worker in enumerate(worker_list)
     }
-    number_of_weighted_shifts = {
-        worker : sum( workplace_weights[pp] * solver.Value(work[ww, dd, pp]) for dd in range(num_days) for pp in range(num_workplaces) )
-        for ww, worker in enumerate(worker_list)
-    }
+    totals = shifts_per_workplace.sum(axis=1)
+    weighted = shifts_per_workplace @ np.array(workplace_weights)
 
-    max_shifts_worker, max_shifts = max( number_of_shifts.items(), key = lambda x : x[1] )
-    min_shifts_worker, min_shifts = min( number_of_shifts.items(), key = lambda x : x[1] )
-    max_weighted_shifts_worker, max_weighted_shifts = max( number_of_weighted_shifts.items(), key = lambda x : x[1] )
-    min_weighted_shifts_worker, min_weighted_shifts = min( number_of_weighted_shifts.items(), key = lambda x : x[1] )
+    i_max, i_min = int(totals.argmax()), int(totals.argmin())
+    max_shifts_worker, max_shifts = worker_list[i_max], int(totals[i_max])
+    min_shifts_worker, min_shifts = worker_list[i_min], int(totals[i_min])
+    i_max, i_min = int(weighted.argmax()), int(weighted.argmin())
+    max_weighted_shifts_worker, max_weighted_shifts = worker_list[i_max], int(weighted[i_max])
+    min_weighted_shifts_worker, min_weighted_shifts = worker_list[i_min], int(weighted[i_min])
 
     assigned_weekend_packages = [ str(worker) for ww, worker in enumerate(worker_list) if solver.Value(assigned_weekends[ww])]
 
@@ -271,20 +327,83 @@ def construct_and_optimize(worker_list : list[Worker], day_list : list[Day], wor
 
 
     print("###########################")
-    print(f"The total imbalance is {solver.Value(total_imbalance)}.")
-    print(f"All imbalances are: {[solver.Value(imbalances[ww]) for ww in range(num_workers) ]}")
+    if penalty_equal_distribution != 0:
+        print(f"The total imbalance is {solver.Value(total_imbalance)}.")
+        print(f"All imbalances are: {[solver.Value(imbalances[ww]) for ww in range(num_workers) ]}")
 
     print(f"The weekend packages were assigned to: {', '.join(assigned_weekend_packages)}.")
 
+    if hint_file is not None:
+        save_hint(hint_file, worker_list, vals)
+
     ########################################################################
     # Write the output as a csv file.
 
     print(f"Writing output to schedule.csv...")
-    with open('schedule.csv', 'w') as myfile:
+    with open('schedule.csv', 'w', newline='', buffering=1<<20) as myfile:
         wr = csv.writer(myfile, quoting=csv.QUOTE_ALL)
-        for row in schedule_array:
-            wr.writerow(row)
+        wr.writerows(schedule_array)
 
     ########################################################################
 
 
+def save_hint(hint_file : str, worker_list : list[Worker], vals : np.ndarray) -> None:
+    """
+    Stores the solution, to be used as a hint in the next run.
+    The workers are stored by name, as their order can change between runs.
+
+    Arguments:
+        hint_file : str
+            The path to the file. Used as given, .npz is not appended.
+        worker_list : list[Worker]
+            List of Worker objects.
+        vals : np.ndarray
+            The solution, vals[ww, dd, pp] = 1 if worker ww works site pp on day dd.
+    """
+    # Save through a file handle, so np.savez does not append .npz to the path.
+    with open(hint_file, 'wb') as f:
+        np.savez(f, workers=np.array([ str(worker) for worker in worker_list ]), vals=vals)
+
+def load_hint(hint_file : str, worker_list : list[Worker], num_days : int, num_workplaces : int) -> np.ndarray | None:
+    """
+    Loads the solution of the previous run, reordered to match the worker_list.
+
+    Arguments:
+        hint_file : str
+            The path to the .npz file.
+        worker_list : list[Worker]
+            List of Worker objects.
+        num_days : int
+            The number of days in the schedule.
+        num_workplaces : int
+            The number of workplaces.
+
+    Returns:
+        np.ndarray | None
+            The hint, hint[ww, dd, pp] = 1 if worker ww worked site pp on day dd.
+            None if the file does not exist, can not be read, does not match the current
+            workers and days, or if the worker names are not unique.
+    """
+    if not os.path.exists(hint_file):
+        return None
+
+    try:
+        with np.load(hint_file) as data:
+            workers = data["workers"].tolist()
+            vals = data["vals"]
+    except (KeyError, ValueError, OSError, zipfile.BadZipFile):
+        print(f"The hint in {hint_file} could not be read, ignoring it.")
+        return None
+
+    # The workers are matched by name, so the names have to be unique.
+    names = [ str(worker) for worker in worker_list ]
+    if len(set(names)) != len(names):
+        print(f"The worker names are not unique, ignoring the hint in {hint_file}.")
+        return None
+
+    if vals.shape != (len(workers), num_days, num_workplaces) or sorted(workers) != sorted(names):
+        print(f"The hint in {hint_file} does not match the schedule, ignoring it.")
+        return None
+
+    index = { name : ii for ii, name in enumerate(workers) }
+    return vals[[ index[name] for name in names ]]
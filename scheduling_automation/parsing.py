@@ -21,8 +21,18 @@ We assume the following format:
 """
 
 import csv
+from functools import lru_cache
+import numpy as np
 from .worker import Worker
 
+# The answers to the weekend package question, and their values.
+_WEEKEND_PACKAGE_MAP = {
+    "Ne" : -1,
+    "Da" : 1,
+    "Vseeno mi je" : 0,
+    "" : 0,
+}
+
 def parse_input(filename : str):
     """
     Parses the input file.
@@ -45,56 +55,70 @@ def parse_input(filename : str):
         # skip the first line
         next(filereader, None)
 
-        worker_list = []
-        for row in filereader:
+        rows = list(filereader)
+
+    # Parse the work dates of all workers at once.
+    # If the rows have different lengths they can not be stacked, so they are parsed one by one.
+    # The mismatch with the calendar is then reported by the caller.
+    work_dates = [ row[4:-2] for row in rows ]
+    if len({ len(x) for x in work_dates }) <= 1:
+        work_dates_mask = parse_work_dates(work_dates)
+    else:
+        work_dates_mask = [ parse_work_dates(x) for x in work_dates ]
 
-            date = row[0] # ignored
-            surname = row[1]
-            name = row[2]
-            workplaces = row[3]
-            work_dates = row[4:-2]
-            weekend_package = row[-2]
-            special_requests = row[-1]
+    worker_list = []
+    for ii, row in enumerate(rows):
 
-            worker = Worker(name=name, surname=surname)
-            worker.workplaces = parse_workplaces(workplaces)
-            worker.work_dates = parse_work_dates(work_dates)
-            worker.weekend_package = parse_weekend_package(weekend_package)
-            worker.special_request = special_requests
+        date = row[0] # ignored
+        surname = row[1]
+        name = row[2]
+        workplaces = row[3]
+        weekend_package = row[-2]
+        special_requests = row[-1]
 
-            worker_list.append(worker)
+        worker = Worker(name=name, surname=surname,
+                        workplaces=parse_workplaces(workplaces),
+                        work_dates=work_dates_mask[ii],
+                        weekend_package=parse_weekend_package(weekend_package),
+                        special_request=special_requests,
+                        )
+
+        worker_list.append(worker)
 
     return worker_list
 
-def parse_workplaces(workplaces : str) -> list[str]:
+@lru_cache(maxsize=None)
+def parse_workplaces(workplaces : str) -> tuple[str, ...]:
     """
     Workplaces are given as one string seprated by commas: "POPs, Porodna".
     Split the string and enforce upper case.
+    The result is cached, as many workers share the same workplaces.
 
     Input:
         workplaces : str
             The string of workplaces from the google doc.
 
     Returns:
-        list[str]
-            Alphabetically ordered list of workplaces.
+        tuple[str, ...]
+            Alphabetically ordered tuple of workplaces.
     """
-    return sorted([ x.strip().upper() for x in workplaces.split(",") ])
+    return tuple(sorted( x.strip().upper() for x in workplaces.split(",") ))
 
-def parse_work_dates(work_dates : list[str]) -> list[bool]:
+def parse_work_dates(work_dates : list[str] | list[list[str]]) -> np.ndarray:
     """
-    Parses the work dates into a boolean list.
+    Parses the work dates into a boolean array.
+    Can parse the work dates of a single worker, or of all workers at once.
 
     Input:
-        work_dates : list[str]
-            The list of work dates.
+        work_dates : list[str] | list[list[str]]
+            The list of work dates, or a list of those for each worker.
             "Ne" means cannot work, empty string means can work.
 
     Returns:
-        list[bool]
-            Boolean list of work dates.
+        np.ndarray
+            Boolean array of work dates, with the same shape as the input.
     """
-    return [ x != "Ne" for x in work_dates]
+    return np.asarray(work_dates, dtype=str) != "Ne"
 
 def parse_weekend_package(weekend_package : str) -> int:
     """
@@ -106,11 +130,7 @@ def parse_weekend_package(weekend_package : str) -> int:
         int
             -1 if does not want, +1 for wants, 0 if they do not care.
     """
-    if weekend_package == "Ne":
-        return -1
-    elif weekend_package == "Da":
-        return 1
-    elif weekend_package in ["Vseeno mi je", ""]:
-        return 0
-    else:
+    value = _WEEKEND_PACKAGE_MAP.get(weekend_package)
+    if value is None:
         raise Exception(f"Unknown weekend package: {weekend_package}.")
+    return value
@@ -2,76 +2,122 @@
 Contains the Worker class.
 """
 
+from functools import lru_cache
+import numpy as np
+
 # These are the workplaces that a Worker can be assigned to.
 # The code assumes that they are ordered alphabetically, and all uppercase.
-ALL_WORKPLACES = [ "NZV", "POPS", "PORODNA", "TX" ]
+ALL_WORKPLACES_ORDERED = ( "NZV", "POPS", "PORODNA", "TX" )
+# The same workplaces as a set, for membership tests.
+ALL_WORKPLACES = frozenset(ALL_WORKPLACES_ORDERED)
+# The index of each workplace in ALL_WORKPLACES_ORDERED.
+_WORKPLACE_ID = { name : ii for ii, name in enumerate(ALL_WORKPLACES_ORDERED) }
+
+@lru_cache(maxsize=64)
+def _normalize_workplaces(value : tuple[str, ...]) -> tuple[int, ...]:
+    """
+    Enforces the workplaces to be upper case, checks if they are recognized,
+    and returns their indices in ALL_WORKPLACES_ORDERED.
+    Cached, as many workers share the same workplaces.
+    """
+    ids = []
+    for x in value:
+        workplace = x.upper()
+        if workplace not in ALL_WORKPLACES:
+            raise ValueError(f"Unrecognized workplace: {workplace!r}.")
+        ids.append(_WORKPLACE_ID[workplace])
+    return tuple(ids)
 
 class Worker:
     """
     A worker is an object containing the information
     about each person: their name, work date preferences,
     etc.
+
+    Attributes:
+        name : str
+        surname : str
+        workplaces : list[str]
+            The workplaces this Worker can work at. Validated when set.
+        work_dates : np.ndarray | None
+            A boolean array, False means that the Worker cannnot work on that day.
+            Converted to a boolean array when set. None if not given.
+        weekend_package : int
+            Whether the Worker wants to work a weekend_package.
+            Can be +1 (wants), 0 (does not care), -1 (does not want).
+        special_request : str
+            A special request is a string they can type into the google doc.
+            Currently ignored.
     """
 
-    def __init__(self, name, surname):
+    __slots__ = ( "name", "surname", "_workplace_ids", "_work_dates", "weekend_package", "special_request" )
+
+    def __init__(self, name, surname, *, workplaces=None, work_dates=None, weekend_package=0, special_request=""):
         self.name = name
         self.surname = surname
+        self.workplaces = workplaces if workplaces is not None else []
+        self.work_dates = work_dates
+        self.weekend_package = weekend_package
+        self.special_request = special_request
 
     @property
     def workplaces(self):
         """
         A list of workplaces this Worker can work at.
         """
-        return self._workplaces
+        return [ ALL_WORKPLACES_ORDERED[ii] for ii in self._workplace_ids ]
 
     @workplaces.setter
     def workplaces(self, value : list[str]):
-        # enforce the workplaces to be upper case
-        value = [ x.upper() for x in value ]
-
-        # Check if the workplaces are recognized.
-        if any([ x not in ALL_WORKPLACES for x in value ]):
-            raise Exception(f"Unrecognized workplace in {value}.")
-        self._workplaces = value
-
+        self._workplace_ids = _normalize_workplaces(tuple(value))
 
     @property
     def work_dates(self):
         """
-        A boolean list, False means that the Worker cannnot work on that day.
+        A boolean array, False means that the Worker cannnot work on that day.
         """
         return self._work_dates
 
     @work_dates.setter
-    def work_dates(self, value : list[bool]):
-        self._work_dates = value
-
+    def work_dates(self, value : list[bool] | np.ndarray | None):
+        self._work_dates = np.asarray(value, dtype=np.bool_) if value is not None else None
 
     @property
-    def weekend_package(self):
+    def workplace_ids(self):
         """
-        Whether the Worker wants to work a weekend_package.
-        Can be +1 (wants), 0 (does not care), -1 (does not want).
+        The indices of the workplaces this Worker can work at,
+        as ordered in ALL_WORKPLACES_ORDERED.
         """
-        return self._weekend_package
+        return self._workplace_ids
 
-    @weekend_package.setter
-    def weekend_package(self, value : int):
-        self._weekend_package = value
 
-
-    @property
-    def special_request(self):
+    @staticmethod
+    def as_arrays(workers : list["Worker"]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        A special request is a string they can type into the google doc.
-        Currently ignored.
+        Stacks the information of all workers into arrays.
+
+        Arguments:
+            workers : list[Worker]
+                The list of workers. All must have their work dates set,
+                with the same number of days.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]
+                The workplace mask of shape (num_workers, num_workplaces), True if the
+                worker can work at the workplace, ordered as in ALL_WORKPLACES_ORDERED,
+                the work dates of shape (num_workers, num_days),
+                and the weekend package preferences of shape (num_workers,).
         """
-        return self._special_request
+        workplace_mask = np.zeros((len(workers), len(ALL_WORKPLACES_ORDERED)), dtype=np.bool_)
+        for ww, worker in enumerate(workers):
+            workplace_mask[ww, list(worker.workplace_ids)] = True
 
-    @special_request.setter
-    def special_request(self, value : str):
-        self._special_request = value
+        if any( worker.work_dates is None for worker in workers ):
+            raise ValueError(f"Work dates are not set for {[ worker for worker in workers if worker.work_dates is None ]}.")
+        work_dates_matrix = np.stack([ worker.work_dates for worker in workers ])
+        weekend_pref = np.array([ worker.weekend_package for worker in workers ], dtype=np.int8)
 
+        return workplace_mask, work_dates_matrix, weekend_pref
 
     def __repr__(self):
-        return self.name + " " + self.surname
+        return f"{self.name} {self.surname}"